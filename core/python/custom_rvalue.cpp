@@ -270,21 +270,21 @@ struct PySequence2RVector{
                 void * arrData = PyArray_DATA(arr);
                 std::memcpy(&(*vec)[0], arrData, vec->size() * sizeof(double));
                 return;
-            } else if (PyArray_TYPE(arr) == 7 && PyArray_ISONESEGMENT(arr)){ //numpy.int64
-                    __DC(arr << " ** from array of type " << PyArray_TYPE(arr))
-
-                    bp::object element;
-
-                    for (GIMLI::Index i = 0; i < vec->size(); i ++){
-                        element = py_sequence[i];
-                        (*vec)[i] = PyArrayScalar_VAL(element.ptr(), Int64);
-
-    //                     __DC(i << " a " << element);
-    //                     __DC(i << " a " << element.ptr()->ob_type->tp_name)
-    //                     __DC(i << " d " <<  PyArrayScalar_VAL(element.ptr(), Int64));
-
-                    }
+            } else if (PyArray_NDIM(arr) == 1){
+                // any other (safely castable) dtype or a strided view:
+                // let numpy cast into a contiguous double array in C,
+                // instead of extracting every element via Python
+                __DC(arr << " ** from array of type " << PyArray_TYPE(arr))
+                PyArrayObject * darr = (PyArrayObject *)PyArray_FROM_OTF(obj,
+                                            NPY_DOUBLE, NPY_ARRAY_IN_ARRAY);
+                if (darr){
+                    std::memcpy(&(*vec)[0], PyArray_DATA(darr),
+                                vec->size() * sizeof(double));
+                    Py_DECREF(darr);
                     return;
+                }
+                PyErr_Clear();
+                __DC("fixme: type=" << PyArray_TYPE(arr))
             } else {
                     __DC("fixme: type=" << PyArray_TYPE(arr))
             }
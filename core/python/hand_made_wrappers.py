@@ -100,6 +100,29 @@ WRAPPER_REGISTRATION_BVector = [
        "PyGIMLI Helper Function: extract a numpy array object from a BVector ");""",
 ]
 
+WRAPPER_DEFINITION_IVector =\
+    """
+#include <numpy/arrayobject.h>
+
+PyObject * IVector_getArray(GIMLI::IVector & vec){
+    import_array2("Cannot import numpy c-api from pygimli hand_make_wrapper", NULL);
+    npy_intp length = (ssize_t)vec.size();
+
+    // SIndex is 32 or 64 bit depending on the platform
+    PyObject * ret = PyArray_SimpleNew(1, &length,
+                        sizeof(GIMLI::SIndex) == 8 ? NPY_INT64 : NPY_INT32);
+    std::memcpy(PyArray_DATA(reinterpret_cast<PyArrayObject*>(ret)),
+                (void *)(&vec[0]), length * sizeof(GIMLI::SIndex));
+
+    return ret;
+}
+
+"""
+WRAPPER_REGISTRATION_IVector = [
+    """def("array", &IVector_getArray,
+       "PyGIMLI Helper Function: extract a numpy array object from a IVector ");""",
+]
+
 WRAPPER_DEFINITION_IndexArray =\
     """
 #include <numpy/arrayobject.h>
@@ -215,6 +238,13 @@ def apply(mb):
     rt.add_declaration_code(WRAPPER_DEFINITION_BVector)
     apply_reg(rt, WRAPPER_REGISTRATION_BVector)
 
+    print("Register 'Vector<SIndex>' handmade wrapper")
+    # the template argument of SIndex differs between platforms, so find
+    # the class by its alias from pygimli.h
+    rt = mb.class_(lambda cls: cls.alias == 'IVector')
+    rt.add_declaration_code(WRAPPER_DEFINITION_IVector)
+    apply_reg(rt, WRAPPER_REGISTRATION_IVector)
+
     #rt = mb.class_('IndexArray')
     #rt.add_declaration_code(WRAPPER_DEFINITION_IndexArray)
     #apply_reg(rt, WRAPPER_REGISTRATION_IndexArray)
@@ -16,9 +16,71 @@
  *                                                                            *
  ******************************************************************************/
 #include "blockmatrix.h"
+#include "calculateMultiThread.h"
+
+#include <algorithm>
 
 namespace GIMLI{
 
+class BlockMatrixMultMT : public BaseCalcMT{
+public:
+    BlockMatrixMultMT(const std::vector< MatrixBase * > & matrices,
+                      const std::vector< BlockMatrixEntry > & entries,
+                      const RVector & b, RVector & ret, bool trans)
+        : BaseCalcMT(false), matrices_(&matrices), entries_(&entries),
+          b_(&b), ret_(&ret), trans_(trans){
+    }
+
+    virtual ~BlockMatrixMultMT(){}
+
+    virtual void calc(){
+        for (Index i = start_; i < end_; i ++){
+            const BlockMatrixEntry & entry = (*entries_)[i];
+            MatrixBase *mat = (*matrices_)[entry.matrixID];
+
+            // entries are disjoint so every thread writes its own slice
+            if (trans_){
+                ret_->addVal(mat->transMult(b_->getVal(entry.rowStart,
+                                            entry.rowStart + mat->rows())) *
+                             entry.scale,
+                             entry.colStart, entry.colStart + mat->cols());
+            } else {
+                ret_->addVal(mat->mult(b_->getVal(entry.colStart,
+                                       entry.colStart + mat->cols())) *
+                             entry.scale,
+                             entry.rowStart, entry.rowStart + mat->rows());
+            }
+        }
+    }
+
+protected:
+    const std::vector< MatrixBase * > * matrices_;
+    const std::vector< BlockMatrixEntry > * entries_;
+    const RVector * b_;
+    RVector * ret_;
+    bool trans_;
+};
+
+template <> bool BlockMatrix< double >::isDisjoint_(bool trans) const{
+    std::vector< std::pair< Index, Index > > ranges;
+    for (Index i = 0; i < entries_.size(); i ++ ){
+        const BlockMatrixEntry & entry = entries_[i];
+        MatrixBase *mat = matrices_[entry.matrixID];
+        if (trans){
+            ranges.push_back(std::make_pair(entry.colStart,
+                                            entry.colStart + mat->cols()));
+        } else {
+            ranges.push_back(std::make_pair(entry.rowStart,
+                                            entry.rowStart + mat->rows()));
+        }
+    }
+    std::sort(ranges.begin(), ranges.end());
+    for (Index i = 1; i < ranges.size(); i ++ ){
+        if (ranges[i].first < ranges[i - 1].second) return false;
+    }
+    return true;
+}
+
 template <> Vector < double > BlockMatrix< double >::mult(const Vector < double >  & b) const{
     // no need to check here .. let the matrices itself check
     // if (b.size() != this->cols()){
@@ -28,6 +90,12 @@ template <> Vector < double > BlockMatrix< double >::mult(const Vector < double
 
     RVector ret(rows_);
 
+    if (parallel_ && threadCount() > 1 && isDisjoint_(false)){
+        distributeCalc(BlockMatrixMultMT(matrices_, entries_, b, ret, false),
+                       entries_.size(), threadCount(), verbose_);
+        return ret;
+    }
+
     for (Index i = 0; i < entries_.size(); i ++ ){
         BlockMatrixEntry entry = entries_[i];
 
@@ -50,7 +118,14 @@ BlockMatrix< double >::transMult(const Vector < double > & b) const{
     // }
 
     RVector ret(cols_);
-        for (Index i = 0; i < entries_.size(); i++){
+
+    if (parallel_ && threadCount() > 1 && isDisjoint_(true)){
+        distributeCalc(BlockMatrixMultMT(matrices_, entries_, b, ret, true),
+                       entries_.size(), threadCount(), verbose_);
+        return ret;
+    }
+
+    for (Index i = 0; i < entries_.size(); i++){
         BlockMatrixEntry entry = entries_[i];
 
         MatrixBase *mat = matrices_[entry.matrixID];
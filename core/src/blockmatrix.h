@@ -43,7 +43,7 @@ template < class ValueType >
 class DLLEXPORT BlockMatrix : public MatrixBase{
 public:
     BlockMatrix(bool verbose=false)
-        : MatrixBase(verbose), rows_(0), cols_(0) {
+        : MatrixBase(verbose), parallel_(false), rows_(0), cols_(0) {
     }
 
     virtual ~BlockMatrix(){
@@ -158,14 +158,29 @@ public:
 
     RSparseMapMatrix sparseMapMatrix() const;
 
+    /*! Distribute the multiplications with the entries on threadCount()
+     * threads if all entries fill disjoint parts of the result,
+     * e.g., for block-diagonal (block-Jacobi) matrices.
+     * Only use this if all submatrices are core matrices. */
+    void setParallel(bool parallel){ parallel_ = parallel; }
+
+    /*! Return true if the multiplications are distributed on threads. */
+    bool parallel() const { return parallel_; }
+
     virtual void save(const std::string & filename) const {
         std::cerr << WHERE_AM_I << "WARNING " << " don't save blockmatrix."  << std::endl;
 //         THROW_TO_IMPL
     }
 
 protected:
+    /*! Return true if the entries write to disjoint row (or for trans
+     * column) ranges of the result so that they can be computed in
+     * parallel. */
+    bool isDisjoint_(bool trans) const;
+
     std::vector< MatrixBase * > matrices_;
     std::vector< BlockMatrixEntry > entries_;
+    bool parallel_;
 private:
     /*! Max row size.*/
     mutable Index rows_;
@@ -183,6 +198,9 @@ template <> DLLEXPORT RVector BlockMatrix< double >::
 template <> DLLEXPORT RSparseMapMatrix BlockMatrix< double >::
     sparseMapMatrix() const;
 
+template <> DLLEXPORT bool BlockMatrix< double >::
+    isDisjoint_(bool trans) const;
+
 inline RVector transMult(const BlockMatrix < double > & A, const RVector & b){
     return A.transMult(b);
 }
@@ -156,6 +156,7 @@ void Mesh::clear(){
     if (cellToBoundaryInterpolationCache_){
         delete cellToBoundaryInterpolationCache_;
     }
+    cellCentersCache_.resize(0);
 
     rangesKnown_ = false;
     neighborsKnown_ = false;
@@ -1172,10 +1173,15 @@ void Mesh::setNodeIDs(IndexArray & ids){
 }
 
 PosVector Mesh::cellCenters() const {
-    PosVector pos(this->cellCount());
-    std::transform(cellVector_.begin(), cellVector_.end(), pos.begin(),
+    if (staticGeometry_ && cellCentersCache_.size() == cellCount()){
+        return cellCentersCache_;
+    }
+
+    cellCentersCache_.resize(cellCount());
+    std::transform(cellVector_.begin(), cellVector_.end(),
+                   cellCentersCache_.begin(),
                    std::mem_fn(&Cell::center));
-    return pos;
+    return cellCentersCache_;
 }
 
 PosVector Mesh::boundaryCenters() const {
@@ -1185,6 +1191,14 @@ PosVector Mesh::boundaryCenters() const {
     return pos;
 }
 
+BVector Mesh::boundaryOutsideMask() const {
+    BVector mask(this->boundaryCount(), false);
+    for (Index i = 0; i < boundaryVector_.size(); i ++){
+        mask[i] = boundaryVector_[i]->outside();
+    }
+    return mask;
+}
+
 RVector & Mesh::cellSizes() const{
 
     if (cellSizesCache_.size() != cellCount()){
@@ -153,8 +153,10 @@ public:
     void clear();
 
     /*!If the mesh is static in geometry and shape some useful information are cached.
-     * (cell sizes, boundary sizes, ...)
-     For dynamic meshes, i.e., node positions can be moved, you have to set staticGeometry to false to avoid any caching.*/
+     * (cell sizes, cell centers, boundary sizes, ...)
+     For dynamic meshes, i.e., node positions can be moved, you have to set staticGeometry to false to avoid any caching.
+     Moving single nodes by Node::setPos does not notify the mesh, so call
+     geometryChanged() afterwards.*/
     void setStaticGeometry(bool stat);
 
     /*! Return true if this mesh have static geometry. [Default=True]*/
@@ -356,13 +358,17 @@ public:
     /*! Return a vector of node positions for an index vector */
     PosVector positions(const IndexArray & idx) const;
 
-    /*! Return a vector of all cell center positions*/
+    /*! Return a vector of all cell center positions. Cached for static geometry.*/
     PosVector cellCenters() const;
     PosVector cellCenter() const { return cellCenters(); }
 
     /*! Return a vector of all center positions for all boundaries */
     PosVector boundaryCenters() const;
 
+    /*! Return a mask that is true for all boundaries on the outside of the
+     * mesh, i.e., boundaries with only a left cell (see Boundary::outside). */
+    BVector boundaryOutsideMask() const;
+
     /*! Return the reference to a RVector of all cell sizes. Cached for static geometry.*/
     RVector & cellSizes() const;
 
@@ -821,6 +827,7 @@ protected:
     bool staticGeometry_;
     bool isGeometry_; // mesh is marked as PLC
     mutable RVector cellSizesCache_;
+    mutable PosVector cellCentersCache_;
     mutable RVector boundarySizesCache_;
     mutable PosVector boundarySizedNormCache_;
 
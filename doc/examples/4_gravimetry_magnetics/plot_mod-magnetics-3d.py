@@ -34,13 +34,16 @@ print(grid)
 # %%%
 # We create a 3D matrix that is later filled as vector into the grid. The
 # model consists of zeros and patches of 5x6 cells per depth slice that
-# are shifted by one cell for subsequent cells.
+# are shifted by one cell for subsequent cells. The patches are set at once
+# by fancy indexing with index arrays for depth slice, y and x.
 #
 
 v = np.zeros((len(z)-1, len(y)-1, len(x)-1))
-for i in range(7):
-    v[1+i, 11-i:16-i, 7:13] = 0.05
+I, J, K = np.meshgrid(np.arange(7), np.arange(5), np.arange(6), indexing='ij')
+v[1+I, 11-I+J, 7+K] = 0.05
 
+# v is C-contiguous with x running fastest like the grid cells, so ravel()
+# returns a view and no copy is made
 grid["synth"] = v.ravel()
 
 # %%%
@@ -112,7 +115,8 @@ data *= np.random.randn(*data.shape)*relError + 1.0
 #
 
 # depth weighting
-bz = np.array([b.center().z() for b in grid.boundaries() if not b.outside()])
+inner = ~np.asarray(grid.boundaryOutsideMask())
+bz = np.array(pg.z(grid.boundaryCenters()))[inner]
 z0 = 25
 wz = 10 / (bz+z0)**1.5
 fop.region(0).setConstraintWeights(wz)
@@ -131,10 +131,10 @@ class PriorFOP(pg.Modelling):
         super().__init__(**kwargs)
         self.setMesh(mesh)
         self.ind = [mesh.findCell(po).id() for po in pos]
-        self.J = pg.SparseMapMatrix()
-        self.J.resize(len(self.ind), mesh.cellCount())
-        for i, ii in enumerate(self.ind):
-            self.J.setVal(i, ii, 1.0)
+        nInd = len(self.ind)
+        self.J = pg.SparseMapMatrix(nInd, mesh.cellCount())
+        self.J.add(pg.core.IndexArray(np.arange(nInd)),
+                   pg.core.IndexArray(self.ind), pg.Vector(nInd, 1.0))
 
         self.setJacobian(self.J)
 
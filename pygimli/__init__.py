@@ -51,14 +51,19 @@ from .core.load import (load, optImport, getCachePath,
 
 
 def checkAndFixLocaleDecimal_point(verbose=False):  # verbose overwritten
+    """Set numeric locale to 'C' if the decimal point is not '.'.
+
+    Cheap to call repeatedly, setlocale is only called if necessary, e.g.,
+    after plt.subplots() reset the locale to the system default.
     """
-    """
-    if locale.localeconv()['decimal_point'] == ',':
-        if verbose:
-            print("Found locale decimal_point ',' "
-                  "and change it to: decimal point '.'")
+    if locale.localeconv()['decimal_point'] == '.':
+        return
+
+    if verbose:
+        print("Found locale decimal_point '{}' "
+              "and change it to: decimal point '.'".format(
+                  locale.localeconv()['decimal_point']))
     try:
-        locale.localeconv()['decimal_point']
         locale.setlocale(locale.LC_NUMERIC, 'C')
     except Exception as e:
         print(e)
@@ -680,6 +680,10 @@ pgcore.RVector.__array__ = __RVectorArrayCall__
 pgcore.BVector.__array__ = __RVectorArrayCall__
 # not yet ready handmade_wrappers.py
 # pgcore.IndexArray.__array__ = __RVectorArrayCall__
+# older core builds lack IVector.array() and fall back to the slow sequence
+# protocol
+if hasattr(pgcore.IVector, 'array'):
+    pgcore.IVector.__array__ = __RVectorArrayCall__
 pgcore.R3Vector.__array__ = __RVectorArrayCall__
 pgcore.RVector3.__array__ = __RVector3ArrayCall__
 
@@ -170,15 +170,82 @@ def __BlockMatrix_addMatrix_happy_GC__(self, M, row=None, col=None,
     return matrixID
 
 
+def __BlockMatrix_freeze__(self):
+    """Assemble all blocks into a single compressed sparse matrix.
+
+    The returned matrix can be used instead of the block matrix, e.g. as
+    constraints matrix, so that every multiplication is a single sparse
+    matrix-vector product instead of one (virtual) call per block.
+    Possible block types are sparse, dense, identity and diagonal matrices.
+
+    Returns
+    -------
+    mat: pg.matrix.SparseMatrix
+        Compressed row storage (CRS) copy of the block matrix.
+    """
+    import pygimli as pg
+    from scipy.sparse import coo_matrix
+
+    rows, cols, vals = [], [], []
+    for entry in self.entries():
+        M = self.__mats__[entry.matrixID]
+
+        if isinstance(M, (pgcore.RSparseMatrix, pgcore.RSparseMapMatrix)):
+            C = pg.utils.sparseMatrix2coo(M)
+        elif isinstance(M, (pgcore.IdentityMatrix, pg.matrix.DiagonalMatrix)):
+            d = np.asarray(M.mult(RVector(M.cols(), 1.0)))
+            idx = np.arange(len(d))
+            C = coo_matrix((d, (idx, idx)), shape=(M.rows(), M.cols()))
+        elif isinstance(M, (pgcore.RMatrix, np.ndarray)):
+            C = coo_matrix(np.asarray(M))
+        else:
+            critical("Can't freeze block matrix containing", type(M))
+
+        if entry.transpose:
+            C = C.T.tocoo()
+
+        rows.append(C.row + entry.rowStart)
+        cols.append(C.col + entry.colStart)
+        vals.append(C.data * entry.scale)
+
+    S = coo_matrix((np.concatenate(vals),
+                    (np.concatenate(rows), np.concatenate(cols))),
+                   shape=(self.rows(), self.cols()))
+    return pg.utils.toSparseMatrix(S.tocsr())
+
+
+def __MatrixBase_asLinearOperator__(self):
+    """Return matrix as scipy.sparse.linalg.LinearOperator.
+
+    Uses the mult and transMult of the matrix so that any (also Python
+    derived) pyGIMLi matrix can be passed to scipy solvers like cg or lsmr.
+    scipy may pass column vectors (N x 1), e.g. from matmat, so they are
+    flattened before and scipy reshapes the flat result as needed.
+    """
+    from scipy.sparse.linalg import LinearOperator
+
+    def matvec(x):
+        return np.ravel(self.mult(np.ravel(x)))
+
+    def rmatvec(x):
+        return np.ravel(self.transMult(np.ravel(x)))
+
+    return LinearOperator((self.rows(), self.cols()),
+                          matvec=matvec, rmatvec=rmatvec,
+                          dtype=getattr(self, 'dtype', float))
+
+
 def __BlockMatrix_str__(self):
     string = ("pg.matrix.BlockMatrix of size %d x %d consisting of %d "
               "submatrices.")
     return string % (self.rows(), self.cols(), len(self.entries()))
 
 
+pgcore.MatrixBase.asLinearOperator = __MatrixBase_asLinearOperator__
 pgcore.RBlockMatrix.addMatrix = __BlockMatrix_addMatrix_happy_GC__
 pgcore.RBlockMatrix.add = __BlockMatrix_addMatrix_happy_GC__
 pgcore.RBlockMatrix.__repr__ = __BlockMatrix_str__
+pgcore.RBlockMatrix.freeze = __BlockMatrix_freeze__
 pgcore.RBlockMatrix.ndim = 2
 # pgcore.CBlockMatrix.addMatrix = __BlockMatrix_addMatrix_happy_GC__
 # pgcore.CBlockMatrix.add = __BlockMatrix_addMatrix_happy_GC__
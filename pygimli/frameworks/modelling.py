@@ -1153,10 +1153,11 @@ class PriorModelling(MeshModelling):
         """Set mesh, save index vector and compute Jacobian."""
         super().setMesh(mesh)
         self.ind = np.array([mesh.findCell(po).id() for po in self.pos])
-        self.J = pg.SparseMapMatrix()
-        self.J.resize(len(self.ind), mesh.cellCount())
-        for i, ii in enumerate(self.ind):
-            self.J.setVal(i, ii, 1.0)
+        nInd = len(self.ind)
+        self.J = pg.SparseMapMatrix(nInd, mesh.cellCount())
+        # fill all entries by a single call instead of a loop over setVal
+        self.J.add(pg.core.IndexArray(np.arange(nInd)),
+                   pg.core.IndexArray(self.ind), pg.Vector(nInd, 1.0))
 
         self.setJacobian(self.J)
 
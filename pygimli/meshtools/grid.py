@@ -156,6 +156,8 @@ def createGridPieShaped(x, degree=10.0, h=2, marker=0):
                     meshR.node(n.id()).setPos(pg.Line([0.0, 0.0],
                                                       n.pos()).at(scale))
 
+    meshR.geometryChanged()
+
     if marker != 0:
         for c in meshR.cells():
             c.setMarker(marker)
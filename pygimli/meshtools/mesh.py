@@ -448,6 +448,7 @@ def extrudeMesh(mesh, a, **kwargs):
                 yP = n.pos()[1]
                 y0 = n0s[xP][1]
                 n.setPos([xP, (yP-y0)*scale[xP] + y0])
+            m2.geometryChanged()
         return m2
 
     if mesh.dim() == 2:
@@ -1499,7 +1500,7 @@ def exportHDF5Mesh(mesh, exportname, group='mesh', indices='cell_indices',
         mesh_cells[i] = cell.ids()
 
     mesh_indices = np.arange(0, mesh.cellCount() + 1, 1, dtype=np.int64)
-    mesh_markers = np.array(mesh.cellMarkers())
+    mesh_markers = np.asarray(mesh.cellMarkers())
 
     with h5py.File(exportname, 'w') as out:
         for grp in np.atleast_1d(group):  # can use more than one group
@@ -1795,6 +1796,8 @@ def transform2DMeshTo3D(mesh, x, y, z=None):
     for i, node in enumerate(mesh.nodes()):
         node.setPos(pg.RVector3(mx[i], my[i], mz[i] + oz[i]))
 
+    mesh.geometryChanged()
+
 
 def rot2DGridToWorld(mesh, start, end):
     """Rotate a 2D mesh into 3D world coordinates.
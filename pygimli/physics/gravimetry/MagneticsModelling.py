@@ -6,7 +6,7 @@ from .kernel import SolveGravMagHolstein
 class MagneticsModelling(pg.Modelling):
     """Magnetics modelling operator using Holstein (2007)."""
 
-    def __init__(self, mesh, points, cmp, igrf, foot=None):
+    def __init__(self, mesh, points, cmp, igrf, foot=None, parallel=False):
         """Setup forward operator.
 
         Parameters
@@ -22,6 +22,10 @@ class MagneticsModelling(pg.Modelling):
             [D, I, H, X, Y, Z, F] - declination, inclination, horizontal field,
                                    X/Y/Z components, total field OR
             [X, Y, Z] - X/Y/Z components
+        foot : float [None]
+            footprint
+        parallel : bool [False]
+            compute the kernel for all points in parallel threads
         """
         # check if components do not contain g!
         super().__init__()
@@ -33,7 +37,8 @@ class MagneticsModelling(pg.Modelling):
         self.kernel = SolveGravMagHolstein(self.mesh,
                                            pnts=self.sensorPositions,
                                            cmp=self.components, igrf=self.igrf,
-                                           foot=self.footprint)
+                                           foot=self.footprint,
+                                           parallel=parallel)
         self.setMesh(mesh)
         self.J = pg.matrix.BlockMatrix()
         self.Ki = []
@@ -3,7 +3,7 @@ import pygimli as pg
 from pygimli.utils import ProgressBar
 
 
-def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
+def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf, parallel=False):
     """Solve gravity and/or magnetics problem after Holstein (1997).
 
     Parameters
@@ -19,6 +19,9 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
         [D, I, H, X, Y, Z, F] - declination, inclination, horizontal field,
                                X/Y/Z components, total field OR
         [X, Y, Z] - X/Y/Z components
+    parallel : bool [False]
+        compute the (independent) observation points in parallel using
+        pg.core.threadCount() threads
 
     Returns
     -------
@@ -30,7 +33,6 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
 
     doB = np.any([c[0] == "B" and len(c) == 2 for c in cmp]) or "TFA" in cmp
     doBT = np.any([c[0] == "B" and len(c) == 3 for c in cmp])
-    B_tens = None
 
     kernel = np.zeros((mesh.cellCount(), len(pnts), len(cmp)))
     # org: this does not make sense as igrf is either 3 or 7 long
@@ -48,7 +50,7 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
     else:
         raise Exception("Could not use IGRF vector. Len must be 3 or 7!")
 
-    b_list, n_list, c_list = [], [], []
+    b_list, c_list = [], []
     for bd in mesh.boundaries():
         b_list.append([n.id() for n in bd.allNodes()])
         c_list.append([bd.leftCell(), bd.rightCell()])
@@ -56,10 +58,7 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
     b_list = np.array(b_list)
     lb = b_list.shape
 
-    for nd in mesh.nodes():
-        n_list.append(nd.pos())
-
-    n_list = np.array(n_list)
+    n_list = np.column_stack([pg.x(mesh), pg.y(mesh), pg.z(mesh)])
 
     cl, cr = [], []
     for i, c in enumerate(c_list):
@@ -74,22 +73,25 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
     rr = range(0, mesh.cellCount())
     rs = np.roll(range(0, lb[1]), -1)
 
-    itest = 0
+    # gather boundary vertex coordinates once into contiguous arrays
+    # (nBoundaries x nVertices x 3), together with the edge geometry that
+    # does not depend on the observation point
+    nb1 = np.ascontiguousarray(n_list[b_list])
+    nb2 = np.ascontiguousarray(nb1[:, rs, :])
+    r0 = nb2 - nb1
+    ll = np.linalg.norm(r0, axis=2)
+    t = r0/np.expand_dims(ll, axis=2)
+
     temp = np.zeros((len(pnts), lb[0], len(cmp)))
-    pBar = ProgressBar(its=len(pnts), width=40, sign='+')
-    for i, p in enumerate(pnts):
-        # if np.floor(100*i/len(pnts)) > itest:
-        #     itest = np.floor(100 * i / len(pnts))
-        #     print('.', end="")
-
-        r1 = n_list[b_list] - p
-        r2 = r1[:, rs, :]
-        r0 = r2 - r1
+
+    def computePoint(i):
+        """Fill temp[i] for the i-th observation point."""
+        p = np.asarray(pnts[i], dtype=float)
+        r1 = nb1 - p
+        r2 = nb2 - p
         u = np.sum(np.cross(r1, r2), 1)
         u = u / np.expand_dims(np.linalg.norm(u, axis=1), axis=1)
-        ut = np.tile(u, lb[1]).reshape((lb[0], lb[1], 3))
-        ll = np.linalg.norm(r0, axis=2)
-        t = r0/np.expand_dims(ll, axis=2)
+        ut = u[:, np.newaxis, :]  # broadcast over edges instead of np.tile
         lm = (np.sum(r1*t, 2) + np.sum(r2*t, 2)) / 2
         h = np.cross(t, ut)
         hn = np.sum(h*r1, 2)
@@ -99,20 +101,21 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
         rm = (r1n+r2n)/2
         lumbda = ll/(2*rm)
 
+        # the transcendentals dominate the kernel, so evaluate them only once
+        # and share them between gravity and magnetics terms
+        atanhL = np.arctanh(lumbda)
+        sAtan = np.sign(v)*np.arctan2(hn*lumbda, (rm*(1-lumbda**2)+abs(v)))
+
         # gravitational field
-        g = hn*np.arctanh(lumbda)-np.sign(v)*v*np.arctan2(
-            hn*lumbda, (rm*(1-lumbda**2)+abs(v)))
+        g = hn*atanhL - v*sAtan
         g_vec = 2 * u * np.expand_dims(np.sum(g, 1), axis=1)
 
         # magnetic field vector and gravity gradient tensor
-        b = h*np.expand_dims(np.arctanh(lumbda), axis=2) - \
-            ut*np.expand_dims(np.sign(v)*np.arctan2(
-                hn*lumbda, (rm*(1-lumbda**2)+abs(v))), axis=2)
+        b = h*np.expand_dims(atanhL, axis=2) - \
+            ut*np.expand_dims(sAtan, axis=2)
 
         P = np.dot(u, B_dir)
-        B_vec = np.expand_dims(P, 1) * np.sum(b, 1)
         B_vec = 2 * np.expand_dims(P, 1) * np.sum(b, 1)
-        pBar.update(i)
         if doBT:  # magnetic gradient tensor
             d = (-2*lumbda*hn) / (r1n*r2n*(1-lumbda**2))
             e = (-2*lumbda*lm) / (r1n*r2n)
@@ -197,6 +200,19 @@ def SolveGravMagHolstein(mesh, pnts, cmp, igrf, foot=np.inf):
             temp[i, :, jj] = fakt * B_tens[:, 2, 2]
             jj += 1
 
+    pBar = ProgressBar(its=len(pnts), width=40, sign='+')
+    if parallel:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # numpy releases the GIL in the vectorized kernel computations
+        with ThreadPoolExecutor(max_workers=pg.core.threadCount()) as pool:
+            for i, _ in enumerate(pool.map(computePoint, range(len(pnts)))):
+                pBar.update(i)
+    else:
+        for i in range(len(pnts)):
+            computePoint(i)
+            pBar.update(i)
+
     kernel += np.array([np.sum(temp[:, cl[cl[:, 1] == j, 0]], 1) for j in rr])
     kernel -= np.array([np.sum(temp[:, cr[cr[:, 1] == j, 0]], 1) for j in rr])
 
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import unittest
+
+import numpy as np
+
+import pygimli as pg
+from pygimli.utils.geostatistics import covarianceMatrixVec
+
+
+class TestMatrix(unittest.TestCase):
+
+    def test_Cm05Matrix(self):
+        x = np.linspace(0, 10, 20)
+        CM = covarianceMatrixVec(x, np.zeros_like(x), I=3)
+        Cm05 = pg.matrix.Cm05Matrix(CM)
+
+        ew, EV = np.linalg.eigh(CM)
+        C05 = EV.dot(np.diag(1./np.sqrt(ew))).dot(EV.T)
+
+        v = np.random.rand(len(x))
+        np.testing.assert_allclose(Cm05.mult(v), C05.dot(v))
+        np.testing.assert_allclose(Cm05.mult(pg.Vector(v)), C05.dot(v))
+
+        # Cholesky variant differs in basis but preserves the norm
+        CmL = pg.matrix.Cm05Matrix(CM, method='chol')
+        np.testing.assert_allclose(np.linalg.norm(CmL.mult(v)),
+                                   np.linalg.norm(C05.dot(v)))
+        np.testing.assert_allclose(CmL.transMult(CmL.mult(v)),
+                                   np.linalg.solve(CM, v))
+
+    def test_GeostatisticConstraintsFFT(self):
+        grid = pg.createGrid(np.arange(11.), np.arange(9.))
+        C = pg.matrix.GeostatisticConstraintsMatrix(mesh=grid, I=[4, 2],
+                                                    dip=10, fft=True)
+        self.assertIsInstance(C.Cm05, pg.matrix.Cm05FFTMatrix)
+        self.assertEqual(C.rows(), grid.cellCount())
+
+        D = pg.matrix.GeostatisticConstraintsMatrix(mesh=grid, I=[4, 2],
+                                                    dip=10)
+        x = np.random.rand(grid.cellCount())
+        np.testing.assert_allclose(C.mult(x), D.mult(x), rtol=1e-6,
+                                   atol=1e-6)
+
+    def test_GeostatisticConstraintsACA(self):
+        from pygimli.utils.geostatistics import covarianceMatrixACA
+
+        x, y = [p.ravel() for p in np.meshgrid(np.arange(0., 10., 0.4),
+                                               np.arange(0., 8., 0.4))]
+        CM = covarianceMatrixVec(x, y, I=[4, 2], dip=10)
+        U, V = covarianceMatrixACA(x, y, I=[4, 2], dip=10, tol=1e-1)
+        self.assertLess(U.shape[1], len(x) // 2)
+        self.assertLess(np.linalg.norm(U.dot(V) - CM) / np.linalg.norm(CM),
+                        0.05)
+
+        grid = pg.createGrid(np.arange(11.), np.arange(9.))
+        C = pg.matrix.GeostatisticConstraintsMatrix(mesh=grid, I=4, aca=True)
+        self.assertIsInstance(C.Cm05, pg.matrix.Cm05LowRankMatrix)
+        D = pg.matrix.GeostatisticConstraintsMatrix(mesh=grid, I=4)
+        x = np.random.rand(grid.cellCount())
+        np.testing.assert_allclose(C.mult(x), D.mult(x), rtol=1e-6,
+                                   atol=1e-6)
+
+    def test_Add2MatrixCache(self):
+        An = np.random.rand(4, 3)
+        A = pg.Matrix(An)
+        d = np.ones(4)
+        J = pg.matrix.Mult2Matrix(pg.matrix.DiagonalMatrix(d), A, cache=True)
+        M = pg.matrix.Add2Matrix(J, J, cache=True)
+        x = np.random.rand(3)
+        np.testing.assert_allclose(M.mult(x), 2 * An.dot(x))
+        np.testing.assert_allclose(M.mult(x), 2 * An.dot(x))
+        x *= 2  # in-place change of the vector invalidates the cache
+        np.testing.assert_allclose(M.mult(x), 2 * An.dot(x))
+        # changing a submatrix in-place needs explicit cache clearance
+        d *= 2.0
+        M.clearCache()
+        np.testing.assert_allclose(M.mult(x), 4 * An.dot(x))
+
+    def test_asLinearOperator(self):
+        from scipy.sparse.linalg import cg
+
+        d = np.arange(1., 6.)
+        L = pg.matrix.DiagonalMatrix(d).asLinearOperator()
+        self.assertEqual(L.shape, (5, 5))
+        x, info = cg(L, d)
+        self.assertEqual(info, 0)
+        np.testing.assert_allclose(x, 1.0)
+        # column vectors as used by matmat
+        np.testing.assert_allclose(L.matmat(np.eye(5)), np.diag(d))
+        np.testing.assert_allclose(L.rmatmat(np.eye(5)), np.diag(d))
+
+    def test_DiagonalMatrix(self):
+        d = np.arange(1., 6.)
+        D = pg.matrix.DiagonalMatrix(d)
+        x = np.ones(5)
+        np.testing.assert_allclose(D.mult(x), d)
+
+        out = np.zeros(5)
+        ret = D.transMult(x, out=out)
+        self.assertIs(ret, out)
+        np.testing.assert_allclose(out, d)
+
+    def test_MultLeftRightMatrixFreeze(self):
+        A = pg.SparseMapMatrix(3, 4)
+        for i in range(3):
+            A.setVal(i, i, 1.0 + i)
+            A.setVal(i, i + 1, -1.0)
+
+        left = np.array([1., 2., 3.])
+        right = np.array([4., 3., 2., 1.])
+        M = pg.matrix.MultLeftRightMatrix(A, left, right)
+        x = np.random.rand(4)
+        y = np.random.rand(3)
+        Mx, MTy = np.array(M.mult(x)), np.array(M.transMult(y))
+
+        S = M.freeze()
+        self.assertIsInstance(S, pg.matrix.SparseMatrix)
+        np.testing.assert_allclose(M.mult(x), Mx)
+        np.testing.assert_allclose(M.transMult(y), MTy)
+
+        # a new matrix discards the frozen product
+        B = pg.SparseMapMatrix(3, 4)
+        for i in range(3):
+            B.setVal(i, i, 2.0)
+        M.A = B
+        np.testing.assert_allclose(M.mult(x), left * 2 * (right * x)[:3])
+
+    def test_MultMatrixWeightCache(self):
+        A = pg.SparseMapMatrix(3, 3)
+        for i in range(3):
+            A.setVal(i, i, 1.0)
+
+        M = pg.matrix.MultLeftRightMatrix(A, np.array([1., 2., 3.]),
+                                          np.ones(3))
+        x = pg.Vector(3, 1.0)
+        np.testing.assert_allclose(M.mult(x), [1., 2., 3.])
+        M.l = np.array([3., 2., 1.])  # new weight invalidates cached vector
+        np.testing.assert_allclose(M.mult(x), [3., 2., 1.])
+        np.testing.assert_allclose(M.transMult(x), [3., 2., 1.])
+
+    def test_MultMatrixIntegerResult(self):
+        A = pg.matrix.RealNumpyMatrix(np.arange(6).reshape(2, 3))
+        M = pg.matrix.MultLeftMatrix(A, np.array([0.5, 2.]))
+        np.testing.assert_allclose(M.mult(np.ones(3, dtype=int)), [1.5, 24.])
+
+
+if __name__ == '__main__':
+    unittest.main()
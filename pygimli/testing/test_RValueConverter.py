@@ -149,6 +149,12 @@ class TestRVectorMethods(unittest.TestCase):
 
         self.assertEqual(pg.sum(x), sum(x))
 
+        # strided view and non-double dtype
+        x = np.arange(20, dtype=np.float64)[::2]
+        np.testing.assert_array_equal(pg.Vector(x), x)
+        x = np.arange(10, dtype=np.float32)
+        np.testing.assert_array_equal(pg.Vector(x), x)
+
     def test_NumpyToCVector(self):
         pass
         # will not work .. until an idea how to choose right api for function with and RVector and CVector, e.g. sum()
@@ -166,6 +166,14 @@ class TestSparseMatrix(unittest.TestCase):
         B.add(A, 10, 10)
         print(B)
 
+        B.add(pg.matrix.IdentityMatrix(2, val=0.5), 12, 0)
+        S = B.freeze()
+        self.assertIsInstance(S, pg.matrix.SparseMatrix)
+        x = np.random.rand(B.cols())
+        np.testing.assert_allclose(S * x, B * x)
+        y = np.random.rand(B.rows())
+        np.testing.assert_allclose(S.transMult(y), B.transMult(y))
+
     def test_Misc(self):
         D = pg.SparseMapMatrix(3, 4)
         for i in range(D.rows()):
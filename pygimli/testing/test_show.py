@@ -231,6 +231,21 @@ def testColorBarFalse():
              cMin=1, cMax=2)
 
 
+def testReplaceDataFreesClosedFigure():
+    import gc
+
+    mesh = pg.createGrid(4, 4)
+    fig, ax = plt.subplots()
+    pg.show(mesh, np.arange(mesh.cellCount()), ax=ax)
+    pg.show(mesh, np.arange(mesh.cellCount())[::-1], ax=ax, replaceData=True)
+    assert len(mesh.gci) == 1
+
+    plt.close(fig)
+    del fig, ax
+    gc.collect()
+    assert len(mesh.gci) == 0
+
+
 def testShowPV():
     """
         import pygimli as pg
@@ -40,20 +40,113 @@ def covarianceMatrixVec(x, y, z=None, I=None, dip=0, strike=0, var=1):
     if z is None:
         z = np.zeros_like(x)
 
-    hx = x - x[:, np.newaxis]
-    hy = y - y[:, np.newaxis]
-    hz = z - z[:, np.newaxis]
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    z = np.asarray(z, dtype=float)
     alpha = -dip * pi / 180  # rotation of operator
     beta = -strike * pi / 180
-    # compute lags, normalized by correlation lengths
-    Hx = (hx*cos(alpha)-hy*sin(alpha))*cos(beta) / I[0]
-    Hy = (hx*sin(alpha)+hy*cos(alpha))*cos(beta) / I[1]
-    Hz = hz * sin(beta) / I[2]
-    CM = var*np.exp(-np.sqrt(Hx**2+Hy**2+Hz**2))  # Covariance matrix
+    # compute lags, normalized by correlation lengths, and accumulate the
+    # squared norm in-place to avoid a bunch of (n x n) temporaries
+    hx = x - x[:, np.newaxis]
+    hy = y - y[:, np.newaxis]
+    cx, cy = cos(alpha) * cos(beta), sin(alpha) * cos(beta)
+    CM = hx * (cx / I[0])
+    CM -= hy * (cy / I[0])  # Hx
+    CM *= CM
+    H = hx * (cy / I[1])
+    H += hy * (cx / I[1])  # Hy
+    H *= H
+    CM += H
+    del hx, hy
+    if sin(beta) != 0:
+        np.subtract(z, z[:, np.newaxis], out=H)
+        H *= sin(beta) / I[2]  # Hz
+        H *= H
+        CM += H
+    del H
+
+    np.sqrt(CM, out=CM)
+    np.negative(CM, out=CM)
+    np.exp(CM, out=CM)
+    CM *= var  # Covariance matrix
 
     return CM
 
 
+def covarianceMatrixACA(x, y, z=None, I=None, dip=0, strike=0, var=1,
+                        tol=1e-6, maxRank=None):
+    """Low-rank factors U, V of the covariance matrix, i.e. CM ~ U @ V.
+
+    Uses the adaptive cross approximation (ACA) with diagonal pivoting,
+    i.e. a pivoted Cholesky decomposition of the positive definite CM. Only
+    single rows of the matrix are evaluated, which needs O(n r) memory and
+    O(n r^2) time instead of O(n^2) for the full matrix of
+    covarianceMatrixVec. In contrast to the row-pivoted ACA, the trace of
+    the remainder is known at every step, so the stopping criterion is
+    reliable also for the rough exponential covariance. Note that the
+    spectrum of the exponential covariance decays slowly, so an accuracy
+    needed for the inverse root (Cm05LowRankMatrix) compresses only for
+    correlation lengths that are large compared to the point spacing.
+
+    Parameters
+    ----------
+    x, y, z : array
+        point coordinates
+    I, dip, strike, var :
+        covariance parameters, see covarianceMatrixVec
+    tol : float [1e-6]
+        relative accuracy in the trace norm, i.e. trace(CM - U @ V) is below
+        tol * trace(CM), the Frobenius norm error is typically much smaller
+    maxRank : int [None]
+        maximum rank, default is the number of points
+
+    Returns
+    -------
+    U, V : np.array (n x r) and (r x n)
+        low-rank factors (V = U.T)
+    """
+    if I is None:
+        I = [1, 1, 1]
+    elif isinstance(I, (float, int)):
+        I = [I, I, I]
+    elif len(I) < 3:
+        I = list(I) + [I[-1]]
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    z = np.zeros_like(x) if z is None else np.asarray(z, dtype=float)
+    n = len(x)
+    maxRank = min(n, maxRank or n)
+    alpha = -dip * pi / 180
+    beta = -strike * pi / 180
+    cx, cy = cos(alpha) * cos(beta), sin(alpha) * cos(beta)
+
+    def row(i):
+        hx, hy, hz = x - x[i], y - y[i], z - z[i]
+        Hx = (hx * cx - hy * cy) / I[0]
+        Hy = (hx * cy + hy * cx) / I[1]
+        Hz = hz * sin(beta) / I[2]
+        return var * np.exp(-np.sqrt(Hx**2 + Hy**2 + Hz**2))
+
+    L = np.empty((n, maxRank))
+    d = np.full(n, float(var))  # diagonal of the remainder
+    trace = d.sum()
+    k = 0
+    while d.sum() > tol * trace:
+        if k == maxRank:
+            pg.warn('ACA reached maxRank={0} with relative trace error {1:e}'
+                    ''.format(maxRank, d.sum() / trace))
+            break
+
+        i = np.argmax(d)
+        L[:, k] = (row(i) - L[:, :k] @ L[i, :k]) / np.sqrt(d[i])
+        d -= L[:, k]**2
+        d[i] = 0
+        k += 1
+
+    return L[:, :k], L[:, :k].T
+
+
 def covarianceMatrixPos(pos, **kwargs):
     """Position (R3Vector) based covariance matrix"""
     return covarianceMatrixVec(np.array(pg.x(pos)), np.array(pg.y(pos)),
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """Define special colorbar behavior."""
+import copy
+import functools
+
 import numpy as np
 from matplotlib.colors import LogNorm, Normalize
 from matplotlib.colorbar import ColorbarBase
@@ -38,12 +41,12 @@ def autolevel(z, nLevs, logScale=None, zMin=None, zMax=None):
         # locator = ticker.MaxNLocator(nBins='auto')
 
     if zMin is None:
-        zMin = min(z)
+        zMin = np.min(z)
         if logScale is True and zMin < 3e-16:
             zMin = pg.core.epsilon(abs(z))
 
     if zMax is None:
-        zMax = max(z)
+        zMax = np.max(z)
 
     # print('autolevel: ', z)
     # print('autolevel:', zMin, zMax, min(z), max(z))
@@ -56,6 +59,13 @@ def autolevel(z, nLevs, logScale=None, zMin=None, zMax=None):
     return levs
 
 
+@functools.lru_cache(maxsize=64)
+def _resampledCmap(name, ncols):
+    """Return the named and resampled matplotlib colormap (cached)."""
+    import matplotlib as mpl
+    return mpl.cm.get_cmap(name, ncols)
+
+
 def cmapFromName(cmapname='jet', ncols=256, bad=None, **kwargs):
     """Get a colormap either from name or from keyworld list.
 
@@ -96,13 +106,17 @@ def cmapFromName(cmapname='jet', ncols=256, bad=None, **kwargs):
 
     if cMapName == 'b2r':
         pg.warn("Don't use manual b2r cMap, use MPL internal 'RdBu' instead.")
-        cMap = "RdBu_r"
-    else:
-        try:
-            import copy
+        cMapName = "RdBu_r"
+
+    try:
+        # resampling builds a new colormap, so reuse it for known names and
+        # only hand out copies as the caller may modify them (e.g. set_bad)
+        if isinstance(cMapName, str):
+            cMap = copy.copy(_resampledCmap(cMapName, ncols))
+        else:
             cMap = copy.copy(mpl.cm.get_cmap(cMapName, ncols))
-        except BaseException as e:
-            pg.warn("Could not retrieve colormap ", cMapName, e)
+    except BaseException as e:
+        pg.warn("Could not retrieve colormap ", cMapName, e)
 
     cMap.set_bad(bad)
     return cMap
@@ -113,7 +127,7 @@ def findAndMaskBestClim(dataIn, cMin=None, cMax=None, dropColLimitsPerc=5,
     """TODO Documentme."""
     data = np.asarray(dataIn)
 
-    if min(data) < 0:
+    if data.min() < 0:
         logScale = False
     if logScale:
         data = np.log10(data)
@@ -175,9 +189,9 @@ def updateColorBar(cbar, gci=None, cMin=None, cMax=None, cMap=None,
     #        logScale, ', nCols:', nCols, nLevs, ', label:', label, levels)
 
     if gci is not None:
-        if min(gci.get_array()) < 1e12:
-            norm = mpl.colors.Normalize(vmin=min(gci.get_array()),
-                                        vmax=max(gci.get_array()))
+        arr = gci.get_array()
+        if arr.min() < 1e12:
+            norm = mpl.colors.Normalize(vmin=arr.min(), vmax=arr.max())
             gci.set_norm(norm)
 
         if cbar is not None:
@@ -225,8 +239,8 @@ def updateColorBar(cbar, gci=None, cMin=None, cMax=None, cMap=None,
 
         if logScale:
             if cMin < 1e-12:
-                cMin = min(filter(lambda _x: _x > 0.0,
-                                  mappable.get_array()))
+                arr = mappable.get_array()
+                cMin = arr[arr > 0.0].min()
 
             norm = mpl.colors.LogNorm(vmin=cMin, vmax=cMax)
         else:
@@ -508,7 +522,7 @@ def setMappableData(mappable, dataIn, cMin=None, cMax=None, logScale=None,
         oldLog = isinstance(mappable.norm, mpl.colors.LogNorm)
         if oldLog is True or logScale is True:
             if cMax > 0:
-                cMin = min(data[data > 0.0])
+                cMin = data[data > 0.0].min()
                 data = np.ma.masked_array(data, data <= 0.0)
             else:
                 # if all data are negative switch to lin scale
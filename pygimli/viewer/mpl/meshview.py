@@ -84,7 +84,8 @@ class CellBrowser(object):
 
         self.fig = self.ax.figure
         self.mesh = None
-        self.data = None
+        self._rawData = None
+        self._data = None
         self.highLight = None
         self.text = None
 
@@ -133,30 +134,54 @@ class CellBrowser(object):
     def setMesh(self, mesh):
         self.mesh = mesh
 
-    def setData(self, data=None):
-        """Set data, if not set look for the artist array data."""
-        self.hide()
-        if data is not None:
+    @property
+    def data(self):
+        """Cell data, mapped to the mesh cells on first access."""
+        if self._data is None and self._rawData is not None:
+            data = self._rawData
+            self._rawData = None
             if len(data) == self.mesh.cellCount():
-                self.data = data
+                self._data = data
             elif len(data) == self.mesh.nodeCount():
-                self.data = pg.meshtools.nodeDataToCellData(self.mesh, data)
+                self._data = pg.meshtools.nodeDataToCellData(self.mesh, data)
             else:
                 pg.warn('Data length mismatch mesh.cellCount(): ' +
                         str(len(data)) + "!=" + str(self.mesh.cellCount()) +
                         ". Mapping data to cellMarkers().")
-                self.data = data[self.mesh.cellMarkers()]
+                self._data = data[self.mesh.cellMarkers()]
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._rawData = None
+        self._data = data
+
+    def setData(self, data=None):
+        """Set data, if not set look for the artist array data.
+
+        The mapping to the mesh cells is deferred to the first pick or key
+        event, so a browser that is never used costs nothing.
+        """
+        self.hide()
+        if data is not None:
+            self._data = None
+            self._rawData = data
 
     def hide(self):
         """Hide info window."""
         self.cellID = -1
 
+        # only redraw if there was something shown
+        redraw = self.highLight is not None
+
         if self.text is not None:
+            redraw = redraw or self.text.get_visible()
             self.text.set_visible(False)
 
         self.removeHighlightCell()
 
-        self.fig.canvas.draw()
+        if redraw:
+            self.fig.canvas.draw()
 
     def removeHighlightCell(self):
         """Remove cell highlights."""
@@ -409,8 +434,10 @@ def drawSelectedMeshBoundaries(ax, boundaries, color=None, linewidth=1.0,
     ----------
     ax : matplotlib axes
         axes to plot into
-    boundaries : :gimliapi:`GIMLI::Mesh` boundary vector
-        collection of boundaries to plot
+    boundaries : :gimliapi:`GIMLI::Mesh` boundary vector | :gimliapi:`GIMLI::Mesh`
+        collection of boundaries to plot, or a mesh together with the
+        boundary indices given by the keyword boundaryIdx (default all),
+        which avoids to access every boundary from Python for 2D meshes
     color : matplotlib color |str [None]
         matching color or string, else colors are according to markers
     linewidth : float [1.0]
@@ -423,22 +450,51 @@ def drawSelectedMeshBoundaries(ax, boundaries, color=None, linewidth=1.0,
     """
     import matplotlib as mpl
     drawAA = True
-    lines = []
 
-    if hasattr(boundaries, '__len__'):
-        if len(boundaries) == 0:
+    if isinstance(boundaries, pg.Mesh) and boundaries.dim() == 2:
+        mesh = boundaries
+        idx = kwargs.pop('boundaryIdx', None)
+        if idx is None:
+            idx = np.arange(mesh.boundaryCount())
+        idx = np.asarray(idx, dtype=int)
+        if len(idx) == 0:
             return
 
-    for bound in boundaries:
-        lines.append(list(zip([bound.node(0).x(), bound.node(1).x()],
-                              [bound.node(0).y(), bound.node(1).y()])))
+        # 2D boundaries are straight edges, so their end points follow
+        # from center and sized normal, rotated by 90 degree, of two bulk
+        # calls instead of fetching node ids boundary by boundary
+        c = np.asarray(mesh.boundaryCenters())[idx, :2]
+        n = np.asarray(mesh.boundarySizedNormals())[idx, :2] / 2.
+        t = np.column_stack([-n[:, 1], n[:, 0]])
+        lines = np.stack([c - t, c + t], axis=1)
+        markers = np.asarray(mesh.boundaryMarkers())[idx]
+    else:
+        if isinstance(boundaries, pg.Mesh):
+            idx = kwargs.pop('boundaryIdx', None)
+            if idx is None:
+                boundaries = boundaries.boundaries()
+            else:
+                boundaries = [boundaries.boundary(int(i)) for i in idx]
+
+        if hasattr(boundaries, '__len__'):
+            if len(boundaries) == 0:
+                return
+
+        lines = []
+        for bound in boundaries:
+            lines.append(list(zip([bound.node(0).x(), bound.node(1).x()],
+                                  [bound.node(0).y(), bound.node(1).y()])))
+        markers = None
 
     lineCollection = mpl.collections.LineCollection(lines,
                                                     antialiaseds=drawAA,
                                                     **kwargs)
 
     if color is None:
-        viewdata = [b.marker() for b in boundaries]
+        if markers is not None:
+            viewdata = markers
+        else:
+            viewdata = [b.marker() for b in boundaries]
         pg.viewer.mpl.setMappableValues(lineCollection, viewdata,
                                         logScale=False)
     else:
@@ -712,7 +768,7 @@ def drawPLC(ax, mesh, fillRegion=True, regionMarker=True,
             pass
             gci = None
         else:
-            markers = np.array(tmpMesh.cellMarkers())
+            markers = np.asarray(tmpMesh.cellMarkers())
             uniquemarkers, uniqueidx = np.unique(markers, return_inverse=True)
             gci = drawModel(ax=ax,
                             data=np.arange(len(uniquemarkers))[uniqueidx],
@@ -851,8 +907,8 @@ def createTriangles(mesh):
         cell indices for each triangle, quad or boundary face
     z : numpy array
         z position for given indices
-    dataIdx : list of int
-        List of indices for a data array
+    dataIdx : numpy array of int
+        Indices for a data array
     """
     if hasattr(mesh, '_triData'):
         if hash(mesh) == mesh._triData[0]:
@@ -877,13 +933,19 @@ def createTriangles(mesh):
     dataIdx = []
 
     for c in ents:
-        triangles.append([c.node(0).id(), c.node(1).id(), c.node(2).id()])
+        # one ids() call instead of node(i).id() per node
+        ids = c.ids()
+        triangles.append([ids[0], ids[1], ids[2]])
         dataIdx.append(c.id())
 
         if c.shape().nodeCount() == 4:
-            triangles.append([c.node(0).id(), c.node(2).id(), c.node(3).id()])
+            triangles.append([ids[0], ids[2], ids[3]])
             dataIdx.append(c.id())
 
+    # store as arrays so repeated draws need no list conversion
+    triangles = np.array(triangles, dtype=int).reshape(-1, 3)
+    dataIdx = np.array(dataIdx, dtype=int)
+
     mesh._triData = [hash(mesh), x, y, triangles, z, dataIdx]
 
     return x, y, triangles, z, dataIdx
@@ -952,7 +1014,7 @@ def drawField(ax, mesh, data=None, levels=None, nLevs=5,
     """
     x, y, triangles, _, dataIndex = createTriangles(mesh)
     if len(data) == mesh.cellCount():
-        z = data[dataIndex]
+        z = np.asarray(data)[dataIndex]
     else:
         z = data
 
@@ -4,8 +4,8 @@
 
 import os
 import sys
-import time
 import traceback
+import weakref
 
 import numpy as np
 
@@ -30,6 +30,16 @@ except ImportError as e:
                 "Ensure that pygimli is in your PYTHONPATH ")
 
 
+_NON_INTERACTIVE_BACKENDS = ('agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg',
+                             'template', 'module://matplotlib_inline.'
+                             'backend_inline')
+
+
+# keyword arguments forwarded from showMesh to the colorbar
+_CBAR_KEYS = frozenset(['cMin', 'cMax', 'nCols', 'nLevs', 'logScale',
+                        'levels'])
+
+
 def show(obj=None, data=None, **kwargs):
     """Mesh and model visualization.
 
@@ -111,14 +121,13 @@ def show(obj=None, data=None, **kwargs):
     # try to interprete obj as mesh or list of meshes
     mesh = kwargs.pop('mesh', obj)
 
-    fitView = kwargs.get('fitView', True)
-
     if isinstance(mesh, list):
         ax = kwargs.pop('ax', None)
-        ax, cBar = show(mesh[0], data, hold=True, ax=ax,
-                        fitView=fitView, **kwargs)
+        fitView = kwargs.pop('fitView', True)
+        kwargs.pop('hold', None)
 
-        for m in mesh[1:]:
+        # fit the view only once for all meshes
+        for m in mesh:
             ax, cBar = show(m, data, ax=ax, hold=True, fitView=False, **kwargs)
 
         if fitView is not False:
@@ -136,11 +145,14 @@ def show(obj=None, data=None, **kwargs):
                 return None, None
 
         if mesh.dim() == 2:
-            if pg.zero(pg.y(mesh)):
+            # same as pg.zero(pg.y(mesh)) but uses the bounding box that the
+            # mesh caches instead of a full node scan, the cache is only
+            # reset by geometryChanged(), so code moving nodes by
+            # Node.setPos must call mesh.geometryChanged() afterwards
+            if max(abs(mesh.yMin()), abs(mesh.yMax())) < 1e-12:
                 pg.info("swap z<->y coordinates for visualization.")
                 meshSwap = pg.Mesh(mesh)
-                for n in meshSwap.nodes():
-                    n.pos()[1] = n.pos()[2]
+                meshSwap.swapCoordinates(1, 2)  # y is zero, no need to keep
                 return showMesh(meshSwap, data, **kwargs)
 
             return showMesh(mesh, data, **kwargs)
@@ -160,6 +172,22 @@ def show(obj=None, data=None, **kwargs):
     return None, None
 
 
+def _uniqueCellMarkers(mesh):
+    """Return unique cell markers and inverse index, cached on the mesh.
+
+    The cache is validated by comparing the markers, which is cheaper than
+    sorting them again when the same mesh is shown repeatedly.
+    """
+    cm = np.asarray(mesh.cellMarkers())
+    cache = getattr(mesh, '_uniqueMarkerCache', None)
+    if cache is not None and np.array_equal(cache[0], cm):
+        return cache[1], cache[2]
+
+    uniquemarkers, uniqueidx = np.unique(cm, return_inverse=True)
+    mesh._uniqueMarkerCache = (cm, uniquemarkers, uniqueidx)
+    return uniquemarkers, uniqueidx
+
+
 def showMesh(mesh, data=None, block=False, colorBar=None,
              label=None, coverage=None, ax=None, savefig=None,
              showMesh=False, showBoundary=None,
@@ -240,6 +268,9 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
             Fit the axes limits to the all content of the axes. Default True.
     boundaryProps: dict
             Arguments for plotboundar
+    rasterized: bool [None]
+            Rasterize the data collection in vector output (pdf, svg, eps).
+            None means automatic, i.e., True for more than 50000 cells.
 
     hold: bool [pg.hold()]
         Holds back the opening of the Figure.
@@ -272,6 +303,7 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
     cMap = kwargs.pop('cMap', 'viridis')
     cBarOrientation = kwargs.pop('orientation', 'horizontal')
     replaceData = kwargs.pop('replaceData', False)
+    rasterized = kwargs.pop('rasterized', None)
 
     if ax is None:
         ax, _ = pg.show(figsize=kwargs.pop('figsize', None), **kwargs)
@@ -288,7 +320,7 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
 
     hold = kwargs.pop('hold', pg.viewer.mpl.utils.__holdAxes__)
 
-    if block is True:
+    if block:
         hold = True
 
     lastHoldStatus = pg.viewer.mpl.utils.__holdAxes__
@@ -301,8 +333,7 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
         kwargs["boundaryMarkers"] = kwargs.get("boundaryMarkers", True)
 
         if mesh.cellCount() > 0:
-            uniquemarkers, uniqueidx = np.unique(
-                np.array(mesh.cellMarkers()), return_inverse=True)
+            uniquemarkers, uniqueidx = _uniqueCellMarkers(mesh)
             label = "Cell markers"
             cMap = pg.plt.cm.get_cmap("Set3", len(uniquemarkers))
             kwargs["logScale"] = False
@@ -321,19 +352,26 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
     elif isinstance(data, pg.core.R3Vector):
         drawStreams(ax, mesh, data, **kwargs)
     else:
+        # element access is slow for core vectors, so fetch it only once
+        first = data[0]
 
         # check for map like data=[[marker, val], ....]
         if isinstance(data, list) and \
-                isinstance(data[0], list) and isinstance(data[0][0], int):
+                isinstance(first, list) and isinstance(first[0], int):
             data = pg.solver.parseMapToCellArray(data, mesh)
+            first = data[0]
 
-        if hasattr(data[0], '__len__') and not \
+        if hasattr(first, '__len__') and not \
                 isinstance(data, np.ma.core.MaskedArray) and not \
-                isinstance(data[0], str):
+                isinstance(first, str):
 
-            # [u,v] x N
-            if len(data) == 2:
-                data = np.array(data).T
+            # one conversion only, lists of vectors have no shape
+            data = np.asarray(data)
+
+            # [u,v] x N, transposed view without copy (N x [u,v] is kept
+            # as it is, also for N == 2)
+            if data.ndim == 2 and data.shape[0] == 2 and data.shape[1] != 2:
+                data = data.T
 
             # N x [u,v]
             if data.shape[1] == 2:
@@ -347,7 +385,6 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
             else:
 
                 # Try animation frames x N
-                data = np.asarray(data)
                 if data.ndim == 2:
                     if data.shape[1] == mesh.cellCount() or \
                        data.shape[1] == mesh.nodeCount():
@@ -362,7 +399,9 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
         #             pg.core.haveInfNaN(data))
         #     showMesh = True
         else:
-            if bool(colorBar) is not False:
+            # normalize truthy flags (e.g. 1), but keep a given colorbar
+            # instance so that it is updated instead of recreated
+            if isinstance(colorBar, (bool, int)) and colorBar:
                 colorBar = True
 
             if len(data) == mesh.cellCount():
@@ -383,8 +422,9 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
                     gci = drawField(ax, mesh, data, **kwargs)
                 else:
                     pg.error("Data size invalid")
-                    print("Data: ", len(data), min(data), max(data),
-                          pg.core.haveInfNaN(data))
+                    arr = np.asarray(data)
+                    print("Data: ", len(arr), arr.min(), arr.max(),
+                          not np.isfinite(arr).all())
                     print("Mesh: ", mesh)
                     validData = False
                     drawMesh(ax, mesh)
@@ -395,9 +435,13 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
                 if label is None:
                     label = ""
 
-                if replaceData and hasattr(mesh, 'gci') and ax in mesh.gci:
-                    gci = mesh.gci[ax]
+                gciRef = getattr(mesh, 'gci', {}).get(ax)
+                if gciRef is not None:
+                    gci = gciRef()
 
+                if replaceData and getattr(gci, 'axes', None) is ax:
+                    # reuse the collection still drawn in ax, only
+                    # replace its values instead of rebuilding the polygons
                     if 'TriContourSet' in str(type(gci)):
                         ax.clear()
                         gci, validData = _drawField(ax, mesh, data, kwargs)
@@ -412,15 +456,25 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
 
                     gci, validData = _drawField(ax, mesh, data, kwargs)
 
-                # Cache mesh and scalarmappable to make replaceData work
+                # Cache mesh and scalarmappable to make replaceData work.
+                # Keys and values are weak, the collection refers to its
+                # axes, so a strong value would keep closed figures alive.
                 if not hasattr(mesh, 'gci'):
-                    mesh.gci = {}
-                mesh.gci[ax] = gci
+                    mesh.gci = weakref.WeakKeyDictionary()
+                if gci is not None:
+                    mesh.gci[ax] = weakref.ref(gci)
 
                 if cMap is not None and gci is not None:
                     gci.set_cmap(cmapFromName(cMap))
                     # gci.cmap.set_under('k')
 
+                # vector output of huge polygon collections is very slow
+                # to write and view, so embed them as image
+                if rasterized is None:
+                    rasterized = mesh.cellCount() > 50000
+                if rasterized and gci is not None:
+                    gci.set_rasterized(True)
+
             except BaseException as e:
                 print(e)
                 traceback.print_exc(file=sys.stdout)
@@ -444,13 +498,12 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
             gci.set_edgecolor(kwargs.pop('color', "0.1"))
         else:
             pg.viewer.mpl.drawSelectedMeshBoundaries(
-                ax, mesh.boundaries(), color=kwargs.pop('color', "0.1"),
-                linewidth=0.3)
+                ax, mesh, color=kwargs.pop('color', "0.1"), linewidth=0.3)
             # drawMesh(ax, mesh, **kwargs)
 
-    if bool(showBoundary) is True:
-        b = mesh.boundaries(mesh.boundaryMarkers() != 0)
-        pg.viewer.mpl.drawSelectedMeshBoundaries(ax, b,
+    if showBoundary:
+        bIdx = np.flatnonzero(np.asarray(mesh.boundaryMarkers()) != 0)
+        pg.viewer.mpl.drawSelectedMeshBoundaries(ax, mesh, boundaryIdx=bIdx,
                                                  color=(0.0, 0.0, 0.0, 1.0),
                                                  linewidth=1.4)
 
@@ -473,8 +526,7 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
 
     # pg._r(validData, gci)
     if validData:
-        labels = ['cMin', 'cMax', 'nCols', 'nLevs', 'logScale', 'levels']
-        subkwargs = {key: kwargs[key] for key in labels if key in kwargs}
+        subkwargs = {key: kwargs[key] for key in _CBAR_KEYS & kwargs.keys()}
 
         subkwargs['cMap'] = cMap
 
@@ -514,16 +566,24 @@ def showMesh(mesh, data=None, block=False, colorBar=None,
             # addCoverageAlpha(gci, pg.core.cellDataToPointData(mesh,
             #                                                   coverage))
 
-    if not hold or block is not False and pg.plt.get_backend().lower() != "agg":
-        if data is not None:
+    if not hold or (block and pg.plt.get_backend().lower() != "agg"):
+        interactive = (pg.plt.get_backend().lower() not in
+                       _NON_INTERACTIVE_BACKENDS)
+
+        # file backends never fire pick or key events
+        if interactive and data is not None:
             if len(data) == mesh.cellCount():
                 CellBrowser(mesh, data, ax=ax)
 
         pg.plt.show(block=block)
-        try:
-            pg.plt.pause(0.01)
-        except BaseException:
-            pass
+
+        # pumping the GUI event loop costs at least 10ms per call and is
+        # useless for file backends
+        if interactive:
+            try:
+                pg.plt.pause(0.01)
+            except BaseException:
+                pass
 
     pg.viewer.mpl.updateAxes(ax)
 
@@ -578,27 +638,35 @@ def showBoundaryNorm(mesh, normMap=None, **kwargs):
     col = kwargs.pop('color', 'Black')
 
     if normMap:
+        centers = np.asarray(mesh.boundaryCenters())
         for pair in normMap:
             bounds = mesh.findBoundaryByMarker(pair[0])
+            if len(bounds) == 0:
+                continue
 
-            for b in bounds:
-                c1 = b.center()
+            c1 = centers[[b.id() for b in bounds]]
 
-                if (pair[1][0] != 0) or (pair[1][1] != 0):
-                    ax.arrow(c1[0], c1[1], pair[1][0], pair[1][1],
-                             head_width=0.1, head_length=0.3, color=col,
-                             **kwargs)
-                else:
-                    ax.plot(c1[0], c1[1], 'o', color=col)
+            # one artist per marker instead of one patch per boundary
+            if (pair[1][0] != 0) or (pair[1][1] != 0):
+                n = np.ones(len(c1))
+                ax.quiver(c1[:, 0], c1[:, 1], n * pair[1][0], n * pair[1][1],
+                          angles='xy', scale_units='xy', scale=1,
+                          color=col, **kwargs)
+            else:
+                ax.plot(c1[:, 0], c1[:, 1], 'o', color=col)
         return
 
     ax = show(mesh, hold=True, ax=ax)[0]
-    for b in mesh.boundaries():
-        c1 = b.center()
-        c2 = c1 + b.norm()
-        ax.plot([c1[0], c2[0]], [c1[1], c2[1]], color=col, **kwargs)
 
-    time.sleep(0.05)
+    # all centers and unit normals in bulk, drawn as one line collection
+    from matplotlib.collections import LineCollection
+
+    c1 = np.asarray(mesh.boundaryCenters())[:, :2]
+    norm = np.asarray(mesh.boundarySizedNormals())[:, :2] / \
+        np.asarray(mesh.boundarySizes())[:, np.newaxis]
+    ax.add_collection(LineCollection(np.stack([c1, c1 + norm], axis=1),
+                                     colors=col, **kwargs))
+    ax.autoscale_view()
 
     return ax
 